@@ -16,7 +16,7 @@
 from urllib import urlencode
 
 from oio.common.easy_value import true_value
-from oio.common.json import json as jsonlib
+from oio.common.json import json as jsonlib, fast_json
 from oio.common.http_urllib3 import urllib3, get_pool_manager, \
     oio_exception_from_httperror
 from oio.common import exceptions
@@ -150,7 +150,7 @@ class HttpApi(object):
         # Convert json and add Content-Type
         if json:
             out_headers["Content-Type"] = "application/json"
-            data = jsonlib.dumps(json)
+            data = fast_json.dumps(json)
 
         # Trigger performance measurments
         perfdata = kwargs.get('perfdata', None)
@@ -20,3 +20,10 @@ try:
     import simplejson as json
 except ImportError:
     import json  # noqa
+
+try:
+    # Faster on small documents, but does not support all the options
+    # of the standard module: use it only for plain dumps() and loads().
+    import ujson as fast_json
+except ImportError:
+    fast_json = json
@@ -13,12 +13,17 @@
 # You should have received a copy of the GNU Lesser General Public
 # License along with this library.
 
+import math
 
 from oio.common import exceptions
 from oio.common.client import ProxyClient
+from oio.common.green import GreenPile
 from oio.common.json import json
 
 
+PARALLEL_LIST_MANY = 4
+
+
 class DirectoryClient(ProxyClient):
     """
     Mid-level client for OpenIO SDS service directory (meta0, meta1).
@@ -79,6 +84,92 @@ class DirectoryClient(ProxyClient):
         _resp, body = self._request('GET', '/show', params=params, **kwargs)
         return body
 
+    def list_many(self, account=None, references=None, service_type=None,
+                  batch_size=256, concurrency=PARALLEL_LIST_MANY, **kwargs):
+        """
+        List the services of the specified type linked to several
+        references of the same account.
+
+        :param references: names of the references
+        :type references: iterable of `str`
+        :param batch_size: maximum number of references per request
+            (smaller batches are sent to keep `concurrency` requests
+            in flight)
+        :type batch_size: `int`
+        :param concurrency: maximum number of requests sent in parallel
+        :type concurrency: `int`
+        :returns: a dictionary with reference names as keys, and either
+            a dictionary with a 'srv' entry (like `list`) or the exception
+            raised for this reference as values.
+        :rtype: `dict`
+        """
+        references = list(references or ())
+        # Make enough batches to keep `concurrency` requests in flight,
+        # the proxy resolves the references of a batch sequentially.
+        batch_size = min(batch_size, max(
+            1, int(math.ceil(len(references) / float(concurrency)))))
+        batches = [references[i:i + batch_size]
+                   for i in range(0, len(references), batch_size)]
+        # If the proxy does not support batches, each batch falls back
+        # to parallel single requests: share the concurrency among them.
+        sub_concurrency = max(1, concurrency // max(1, len(batches)))
+        pile = GreenPile(concurrency)
+        for batch in batches:
+            pile.spawn(self._list_many, account, batch, service_type,
+                       concurrency=sub_concurrency, **kwargs)
+        results = dict()
+        for batch_results in pile:
+            results.update(batch_results)
+        return results
+
+    def _list_one(self, account, reference, service_type, **kwargs):
+        try:
+            return self.list(account, reference, service_type=service_type,
+                             **kwargs)
+        except exceptions.OioException as exc:
+            return exc
+
+    def _list_many(self, account, references, service_type,
+                   concurrency=PARALLEL_LIST_MANY, **kwargs):
+        params = self._make_params(account, service_type=service_type)
+        data = json.dumps({'references': references})
+        try:
+            _resp, body = self._request('POST', '/show_many', params=params,
+                                        data=data, **kwargs)
+        except exceptions.TooLarge as exc:
+            # Batch too large for the proxy
+            if len(references) <= 1:
+                return dict.fromkeys(references, exc)
+            pivot = len(references) // 2
+            results = self._list_many(account, references[:pivot],
+                                      service_type, concurrency=concurrency,
+                                      **kwargs)
+            results.update(self._list_many(account, references[pivot:],
+                                           service_type,
+                                           concurrency=concurrency,
+                                           **kwargs))
+            return results
+        except exceptions.NotFound:
+            # Batches not supported by the proxy, send the requests
+            # one by one, but in parallel.
+            pile = GreenPile(concurrency)
+            for ref in references:
+                pile.spawn(self._list_one, account, ref, service_type,
+                           **kwargs)
+            return dict(zip(references, pile))
+        except exceptions.OioException as exc:
+            # The whole batch failed, report the error for each reference
+            return dict.fromkeys(references, exc)
+
+        results = dict()
+        for item in body['references']:
+            if item['status'] == 200:
+                results[item['name']] = {'srv': item.get('srv') or list()}
+            else:
+                results[item['name']] = exceptions.from_status(
+                    item['status'], item.get('message'))
+        return results
+
     def show(self, *args, **kwargs):
         """
         :deprecated: use `list`
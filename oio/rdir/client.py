@@ -19,31 +19,34 @@ import random
 from oio.api.base import HttpApi
 from oio.common.constants import REQID_HEADER
 from oio.common.exceptions import ClientException, NotFound, VolumeException
-from oio.common.exceptions import ServiceUnavailable, ServerException
+from oio.common.exceptions import ServiceUnavailable, ServerException, \
+    Conflict
 from oio.common.exceptions import OioNetworkException, OioException, \
     reraise as oio_reraise
-from oio.common.utils import group_chunk_errors, request_id
+from oio.common.utils import group_chunk_errors, request_id, \
+    monotonic_time, CacheDict
 from oio.common.logger import get_logger
 from oio.common.decorators import ensure_headers, ensure_request_id
 from oio.conscience.client import ConscienceClient
 from oio.directory.client import DirectoryClient
 from oio.common.utils import depaginate, cid_from_name
-from oio.common.green import sleep
-from oio.common.easy_value import true_value
+from oio.common.green import GreenPool, greenthread, sleep
+from oio.common.easy_value import float_value, int_value, true_value
 from oio.common.constants import HEADER_PREFIX
 
 RDIR_ACCT = '_RDIR'
+RDIR_POOL_CONNECTIONS = 64
 
 # Special target that will match any service from the "known" service list
 JOKER_SVC_TARGET = '__any_slot'
 
 
 def _make_id(ns, type_, addr):
-    return "%s|%s|%s" % (ns, type_, addr)
+    return '|'.join((ns, type_, addr))
 
 
 def _filter_rdir_host(allsrv):
-    for srv in allsrv.get('srv', {}):
+    for srv in allsrv.get('srv') or ():
         if srv['type'] == 'rdir':
             return srv['host']
     raise NotFound("No rdir service found in %s" % (allsrv,))
@@ -54,13 +57,21 @@ class RdirDispatcher(object):
         self.conf = conf
         self.ns = conf['namespace']
         self.logger = get_logger(conf)
-        self.directory = DirectoryClient(conf, logger=self.logger, **kwargs)
         if rdir_client:
             self.rdir = rdir_client
         else:
             self.rdir = RdirClient(conf, logger=self.logger, **kwargs)
+        # Share the connections with the rdir client
+        kwargs['pool_manager'] = self.rdir.pool_manager
+        self.directory = DirectoryClient(conf, logger=self.logger, **kwargs)
         self._cs = None
         self._pool_options = None
+        self.lookup_concurrency = int_value(conf.get('lookup_concurrency'),
+                                            32)
+        # IDs of rdir services are this prefix followed by their address
+        self._rdir_id_prefix = _make_id(self.ns, 'rdir', '')
+        # (timestamp, all rdir services)
+        self._rdir_cache = (0, None)
 
     @property
     def cs(self):
@@ -69,6 +80,26 @@ class RdirDispatcher(object):
                                         pool_manager=self.rdir.pool_manager)
         return self._cs
 
+    def _all_rdir_cached(self, ttl=5.0, **kwargs):
+        """
+        Get the list of all rdir services, and a dictionary of the same
+        services indexed by their ID. The list from the conscience
+        is cached for `ttl` seconds, but each call gets its own copy
+        of the service descriptions, which callers are free to modify.
+        """
+        now = monotonic_time()
+        cached_at, cached = self._rdir_cache
+        if cached is None or now - cached_at >= ttl:
+            cached = self.cs.all_services('rdir', True, **kwargs)
+            self._rdir_cache = (now, cached)
+        all_rdir = [dict(x, tags=dict(x.get('tags') or {})) for x in cached]
+        rdir_prefix = self._rdir_id_prefix
+        by_id = {rdir_prefix + x['addr']: x for x in all_rdir}
+        return all_rdir, by_id
+
+    def _clear_rdir_cache(self):
+        self._rdir_cache = (0, None)
+
     def get_assignments(self, service_type, **kwargs):
         """
         Get rdir assignments for all services of the specified type.
@@ -78,21 +109,26 @@ class RdirDispatcher(object):
         :rtype: `tuple<list<dict>,list<dict>>`
         """
         all_services = self.cs.all_services(service_type, **kwargs)
-        all_rdir = self.cs.all_services('rdir', True, **kwargs)
-        by_id = {_make_id(self.ns, 'rdir', x['addr']): x
-                 for x in all_rdir}
-
-        for service in all_services:
+        all_rdir, by_id = self._all_rdir_cached(**kwargs)
+
+        rdir_prefix = self._rdir_id_prefix
+        refs = [service.get('tags', {}).get('tag.service_id') or
+                service['addr'] for service in all_services]
+        resps = self.directory.list_many(
+            RDIR_ACCT, refs, service_type='rdir',
+            concurrency=self.lookup_concurrency, **kwargs)
+
+        # rdir service addresses, by volume ID
+        rdir_addrs = dict()
+        for ref, service in zip(refs, all_services):
             try:
-                ref = service.get('tags', {}).get('tag.service_id')
-                resp = self.directory.list(RDIR_ACCT,
-                                           ref or service['addr'],
-                                           service_type='rdir',
-                                           **kwargs)
+                resp = resps.get(ref) or NotFound(message=ref)
+                if isinstance(resp, Exception):
+                    raise resp
                 rdir_host = _filter_rdir_host(resp)
+                rdir_addrs[ref] = rdir_host
                 try:
-                    service['rdir'] = by_id[
-                        _make_id(self.ns, 'rdir', rdir_host)]
+                    service['rdir'] = by_id[rdir_prefix + rdir_host]
                 except KeyError:
                     self.logger.warn("rdir %s linked to %s %s seems down",
                                      rdir_host, service_type,
@@ -100,17 +136,19 @@ class RdirDispatcher(object):
                     service['rdir'] = {"addr": rdir_host,
                                        "tags": dict()}
                     loc_rdir = service['rdir']
-                    by_id[_make_id(self.ns, 'rdir', rdir_host)] = loc_rdir
+                    by_id[rdir_prefix + rdir_host] = loc_rdir
             except NotFound:
                 self.logger.info("No rdir linked to %s",
                                  service['addr'])
             except OioException as exc:
                 self.logger.warn('Failed to get rdir linked to %s: %s',
                                  service['addr'], exc)
+        # Save future lookups to the rdir client
+        self.rdir.warm_cache(rdir_addrs)
         return all_services, all_rdir
 
-    def assign_services(self, service_type,
-                        max_per_rdir=None, min_dist=None, **kwargs):
+    def assign_services(self, service_type, max_per_rdir=None,
+                        min_dist=None, max_attempts=7, **kwargs):
         """
         Assign an rdir service to all `service_type` servers that aren't
         already assigned one.
@@ -120,53 +158,105 @@ class RdirDispatcher(object):
         :param min_dist: minimum required distance between any service and
             its assigned rdir service.
         :type min_dist: `int`
+        :param max_attempts: maximum number of attempts to save the link
+            between a service and its rdir service.
+        :type max_attempts: `int`
         :returns: The list of `service_type` services that were assigned
             rdir services.
         """
         all_services = self.cs.all_services(service_type, **kwargs)
-        all_rdir = self.cs.all_services('rdir', True, **kwargs)
+        all_rdir, by_id = self._all_rdir_cached(**kwargs)
         if len(all_rdir) <= 0:
             raise ServiceUnavailable("No rdir service found in %s" % self.ns)
 
-        by_id = {_make_id(self.ns, 'rdir', x['addr']): x
-                 for x in all_rdir}
+        rdir_prefix = self._rdir_id_prefix
+        provider_ids = [provider['tags'].get('tag.service_id',
+                                             provider['addr'])
+                        for provider in all_services]
+        resps = self.directory.list_many(
+            RDIR_ACCT, provider_ids, service_type='rdir',
+            concurrency=self.lookup_concurrency, **kwargs)
 
         errors = list()
-        for provider in all_services:
-            provider_id = provider['tags'].get('tag.service_id',
-                                               provider['addr'])
-
+        # Services needing an rdir, with the rdir selected for them
+        to_link = list()
+        # IDs of the rdir services to avoid when linking, computed when
+        # needed, then updated each time an rdir service gets a new base.
+        avoids = None
+        upper_limit = n_valid = n_linked = 0
+        for provider_id, provider in zip(provider_ids, all_services):
             try:
-                resp = self.directory.list(RDIR_ACCT, provider_id,
-                                           service_type='rdir', **kwargs)
+                resp = resps.get(provider_id) or NotFound(message=provider_id)
+                if isinstance(resp, Exception):
+                    raise resp
                 rdir_host = _filter_rdir_host(resp)
                 try:
-                    provider['rdir'] = by_id[_make_id(self.ns, 'rdir',
-                                                      rdir_host)]
+                    provider['rdir'] = by_id[rdir_prefix + rdir_host]
                 except KeyError:
                     self.logger.warn("rdir %s linked to %s %s seems down",
                                      rdir_host, service_type,
                                      provider_id)
             except NotFound:
                 try:
-                    rdir = self._smart_link_rdir(provider_id, all_rdir,
-                                                 service_type=service_type,
-                                                 max_per_rdir=max_per_rdir,
-                                                 min_dist=min_dist,
-                                                 **kwargs)
+                    # When linking to the average, the average increases
+                    # by one every `n_valid` links: compute it again.
+                    if avoids is None or n_linked >= n_valid:
+                        avoids, upper_limit, n_valid = \
+                            self._compute_avoids(all_rdir, max_per_rdir)
+                        n_linked = 0
+                    polled = self._select_rdir(provider_id, all_rdir,
+                                               service_type=service_type,
+                                               max_per_rdir=max_per_rdir,
+                                               min_dist=min_dist,
+                                               avoids=avoids,
+                                               **kwargs)
                 except OioException as exc:
                     self.logger.warn("Failed to link an rdir to %s %s: %s",
                                      service_type, provider_id, exc)
                     errors.append((provider_id, exc))
                     continue
-                n_bases = by_id[rdir]['tags'].get("stat.opened_db_count", 0)
-                by_id[rdir]['tags']["stat.opened_db_count"] = n_bases + 1
-                provider['rdir'] = by_id[rdir]
+                rdir = polled['id']
+                if rdir not in by_id:
+                    # Unknown to our (outdated) list of rdir services
+                    self._clear_rdir_cache()
+                    by_id[rdir] = {'addr': polled['addr'], 'tags': dict()}
+                # Count the base now, so the next selections are balanced
+                n_bases = by_id[rdir]['tags'].get(
+                    "stat.opened_db_count", 0) + 1
+                by_id[rdir]['tags']["stat.opened_db_count"] = n_bases
+                to_link.append((provider_id, provider, polled))
+                n_linked += 1
+                if n_bases > upper_limit and rdir not in avoids:
+                    avoids.append(rdir)
             except OioException as exc:
                 self.logger.warn("Failed to check rdir linked to %s %s "
                                  "(thus won't try to make the link): %s",
                                  service_type, provider_id, exc)
                 errors.append((provider_id, exc))
+
+        def _link(link):
+            provider_id, _provider, polled = link
+            try:
+                self._link_rdir(provider_id, polled,
+                                max_attempts=max_attempts,
+                                service_type=service_type, **kwargs)
+            except OioException as exc:
+                return exc
+
+        # Save the links in parallel
+        pool = GreenPool(self.lookup_concurrency)
+        for link, exc in zip(to_link, pool.imap(_link, to_link)):
+            provider_id, provider, polled = link
+            rdir = by_id[polled['id']]
+            if exc is None:
+                provider['rdir'] = rdir
+                continue
+            self.logger.warn("Failed to link an rdir to %s %s: %s",
+                             service_type, provider_id, exc)
+            errors.append((provider_id, exc))
+            # The rdir service did not get the base after all
+            rdir['tags']["stat.opened_db_count"] -= 1
+
         if errors:
             # group_chunk_errors is flexible enough to accept service addresses
             errors = group_chunk_errors(errors)
@@ -199,27 +289,51 @@ class RdirDispatcher(object):
         """
         return self.assign_services("rawx", max_per_rdir, **kwargs)
 
-    def _smart_link_rdir(self, volume_id, all_rdir, max_per_rdir=None,
-                         max_attempts=7, service_type='rawx', min_dist=None,
-                         **kwargs):
+    def _compute_avoids(self, all_rdir, max_per_rdir=None):
         """
-        Force the load balancer to avoid services that already host more
-        bases than the average (or more than `max_per_rdir`)
-        while selecting rdir services.
+        Find the rdir services that already host more bases than
+        the average (or more than `max_per_rdir`).
+
+        :returns: a tuple with the list of IDs of the services to avoid,
+            the maximum number of bases a service should host,
+            and the number of valid rdir services.
         """
-        opened_db = [x['tags'].get('stat.opened_db_count', 0) for x in all_rdir
-                     if x['score'] > 0]
+        # Extract the number of bases of valid services only once,
+        # and sum them at the same time.
+        opened_db = list()
+        total = 0
+        for rdir in all_rdir:
+            if rdir['score'] > 0:
+                count = rdir['tags'].get('stat.opened_db_count', 0)
+                total += count
+                opened_db.append((count, rdir['addr']))
         if len(opened_db) <= 0:
             raise ServiceUnavailable(
                 "No valid rdir service found in %s" % self.ns)
         if not max_per_rdir:
-            upper_limit = sum(opened_db) / float(len(opened_db))
+            upper_limit = total / float(len(opened_db))
         else:
             upper_limit = max_per_rdir - 1
-        avoids = [_make_id(self.ns, "rdir", x['addr'])
-                  for x in all_rdir
-                  if x['score'] > 0 and
-                  x['tags'].get('stat.opened_db_count', 0) > upper_limit]
+        rdir_prefix = self._rdir_id_prefix
+        avoids = [rdir_prefix + addr
+                  for count, addr in opened_db
+                  if count > upper_limit]
+        return avoids, upper_limit, len(opened_db)
+
+    def _select_rdir(self, volume_id, all_rdir, max_per_rdir=None,
+                     service_type='rawx', min_dist=None, avoids=None,
+                     **kwargs):
+        """
+        Force the load balancer to avoid services that already host more
+        bases than the average (or more than `max_per_rdir`)
+        while selecting rdir services.
+
+        :param avoids: IDs of the rdir services to avoid, as returned by
+            `_compute_avoids` (computed from `all_rdir` if not specified)
+        :returns: the description of the selected rdir service
+        """
+        if avoids is None:
+            avoids, _, _ = self._compute_avoids(all_rdir, max_per_rdir)
         known = [_make_id(self.ns, service_type, volume_id)]
         try:
             polled = self._poll_rdir(avoid=avoids, known=known,
@@ -229,7 +343,14 @@ class RdirDispatcher(object):
                 raise
             # Retry without `avoids`, hoping the next iteration will rebalance
             polled = self._poll_rdir(known=known, min_dist=min_dist, **kwargs)
+        return polled
 
+    def _link_rdir(self, volume_id, polled, max_attempts=7,
+                   service_type='rawx', **kwargs):
+        """
+        Associate the rdir service `polled` to `volume_id`,
+        and create the database in the rdir service.
+        """
         # Associate the rdir to the rawx
         forced = {'host': polled['addr'], 'type': 'rdir',
                   'seq': 1, 'args': "", 'id': polled['id']}
@@ -265,6 +386,9 @@ class RdirDispatcher(object):
                     continue
                 # Too many attempts
                 raise
+        # The number of bases hosted by the rdir services has changed
+        self._clear_rdir_cache()
+        self.rdir._clear_cache(volume_id)
 
         # Do the creation in the rdir itself
         try:
@@ -272,7 +396,6 @@ class RdirDispatcher(object):
         except Exception as exc:
             self.logger.warn("Failed to create database for %s on %s: %s",
                              volume_id, polled['addr'], exc)
-        return polled['id']
 
     def _create_special_pool(self, options=None, force=False, **kwargs):
         """
@@ -299,9 +422,10 @@ class RdirDispatcher(object):
         if min_dist is not None:
             options['min_dist'] = min_dist
         if options != self._pool_options:
-            # Options have changed, overwrite the pool.
+            # Options have changed (or the pool has never been created
+            # by this dispatcher), overwrite the pool.
+            self._create_special_pool(options, force=True, **kwargs)
             self._pool_options = options
-            self._create_special_pool(self._pool_options, force=True, **kwargs)
 
         try:
             svcs = self.cs.poll('__rawx_rdir', avoid=avoid, known=known,
@@ -309,7 +433,12 @@ class RdirDispatcher(object):
         except ClientException as exc:
             if exc.status != 400:
                 raise
-            self._create_special_pool(self._pool_options, **kwargs)
+            # The pool has been lost (e.g. the proxy has been restarted)
+            try:
+                self._create_special_pool(self._pool_options, **kwargs)
+            except Conflict:
+                # Created in the meantime by someone else
+                pass
             svcs = self.cs.poll('__rawx_rdir', avoid=avoid, known=known,
                                 **kwargs)
         for svc in svcs:
@@ -330,18 +459,49 @@ class RdirClient(HttpApi):
     }
 
     def __init__(self, conf, **kwargs):
+        # One pool of connections per rdir service, plus the proxy
+        kwargs.setdefault('pool_connections', RDIR_POOL_CONNECTIONS)
         super(RdirClient, self).__init__(service_type='rdir', **kwargs)
+        # Reuse the same connections to talk to the proxy
+        kwargs['pool_manager'] = self.pool_manager
         self.directory = DirectoryClient(conf, **kwargs)
         self.ns = conf['namespace']
-        self._addr_cache = dict()
+        cache_size = int_value(conf.get('rdir_addr_cache_size'), 10000)
+        self._addr_cache = CacheDict(cache_size)
+        # Volumes known to have no rdir assigned, with the time of the check
+        self._neg_cache = CacheDict(cache_size)
+        self._neg_cache_ttl = float_value(
+            conf.get('rdir_addr_cache_negative_ttl'), 2.0)
 
     def _clear_cache(self, volume_id):
         self._addr_cache.pop(volume_id, None)
+        self._neg_cache.pop(volume_id, None)
+
+    def warm_cache(self, mapping):
+        """
+        Fill the cache of rdir service addresses, for example with
+        the results of `RdirDispatcher.get_assignments`.
+
+        :param mapping: rdir service addresses, by volume ID
+        :type mapping: `dict`
+        """
+        for volume_id in mapping:
+            self._neg_cache.pop(volume_id, None)
+        self._addr_cache.update(mapping)
 
     def _get_rdir_addr(self, volume_id, reqid=None):
         # Initial lookup in the cache
-        if volume_id in self._addr_cache:
-            return self._addr_cache[volume_id]
+        host = self._addr_cache.pop(volume_id, None)
+        if host is not None:
+            # Mark the entry as recently used
+            self._addr_cache[volume_id] = host
+            return host
+        checked_at = self._neg_cache.get(volume_id)
+        if checked_at is not None:
+            if monotonic_time() - checked_at < self._neg_cache_ttl:
+                raise VolumeException(
+                    'No rdir assigned to volume %s' % volume_id)
+            del self._neg_cache[volume_id]
         # Not cached, try a direct lookup
         try:
             headers = {REQID_HEADER: reqid or request_id()}
@@ -353,6 +513,7 @@ class RdirClient(HttpApi):
             self._addr_cache[volume_id] = host
             return host
         except NotFound:
+            self._neg_cache[volume_id] = monotonic_time()
             raise VolumeException('No rdir assigned to volume %s' % volume_id)
 
     def _make_uri(self, action, volume_id, reqid=None, service_type='rawx'):
@@ -393,9 +554,7 @@ class RdirClient(HttpApi):
         body = {'container_id': container_id,
                 'content_id': content_id,
                 'chunk_id': chunk_id}
-
-        for key, value in data.iteritems():
-            body[key] = value
+        body.update(data)
 
         self._rdir_request(volume_id, 'POST', 'push', create=True,
                            json=body, headers=headers)
@@ -410,11 +569,82 @@ class RdirClient(HttpApi):
         self._rdir_request(volume_id, 'DELETE', 'delete',
                            json=body, **kwargs)
 
-    def chunk_fetch(self, volume, limit=1000, rebuild=False,
+    def _chunk_fetch_page(self, volume, req_body, max_attempts=3,
+                          **kwargs):
+        for i in range(max_attempts):
+            try:
+                return self._rdir_request(
+                    volume, 'POST', 'fetch', json=req_body, **kwargs)
+            except OioNetworkException:
+                # Monotonic backoff
+                if i < max_attempts - 1:
+                    sleep(i * 1.0)
+                    continue
+                # Too many attempts
+                raise
+
+    def _chunk_fetch_pages(self, volume, limit=4096, rebuild=False,
+                           container_id=None, max_attempts=3,
+                           start_after=None, shuffle=False, **kwargs):
+        """
+        Fetch the list of chunks belonging to the specified volume,
+        and yield the pages of results as returned by the rdir service.
+        The next page of results is requested while the current one
+        is being consumed.
+        """
+        req_body = {'limit': limit}
+        if rebuild:
+            req_body['rebuild'] = True
+        if container_id:
+            req_body['container_id'] = container_id
+        if start_after:
+            req_body['start_after'] = start_after
+
+        _resp, resp_body = self._chunk_fetch_page(
+            volume, req_body, max_attempts=max_attempts, **kwargs)
+        next_page = None
+        try:
+            while True:
+                truncated = _resp.headers.get(
+                        HEADER_PREFIX + 'list-truncated')
+                if truncated is None:
+                    # TODO(adu): Delete when it will no longer be used
+                    if not resp_body:
+                        break
+                    truncated = True
+                    req_body['start_after'] = resp_body[-1][0]
+                else:
+                    truncated = true_value(truncated)
+                    if truncated:
+                        req_body['start_after'] = _resp.headers[
+                            HEADER_PREFIX + 'list-marker']
+
+                if truncated:
+                    next_page = greenthread.spawn(
+                        self._chunk_fetch_page, volume, dict(req_body),
+                        max_attempts=max_attempts, **kwargs)
+
+                if shuffle:
+                    random.shuffle(resp_body)
+                if resp_body:
+                    yield resp_body
+
+                if not truncated:
+                    break
+                page, next_page = next_page, None
+                _resp, resp_body = page.wait()
+        finally:
+            # The consumer stopped early, do not fetch the next page
+            if next_page is not None:
+                next_page.kill()
+
+    def chunk_fetch(self, volume, limit=4096, rebuild=False,
                     container_id=None, max_attempts=3,
                     start_after=None, shuffle=False, **kwargs):
         """
         Fetch the list of chunks belonging to the specified volume.
+        The next page of results is requested while the current one
+        is being consumed.
 
         :param volume: the volume to get chunks from
         :type volume: `str`
@@ -430,51 +660,42 @@ class RdirClient(HttpApi):
         :keyword start_after: fetch only chunk that appear after
             this container ID
         :type start_after: `str`
+        :keyword shuffle: shuffle the entries of each page
+        :type shuffle: `bool`
+        :returns: a generator of (container, content, chunk, value) tuples
         """
-        req_body = {'limit': limit}
-        if rebuild:
-            req_body['rebuild'] = True
-        if container_id:
-            req_body['container_id'] = container_id
-        if start_after:
-            req_body['start_after'] = start_after
-
-        while True:
-            for i in range(max_attempts):
-                try:
-                    _resp, resp_body = self._rdir_request(
-                        volume, 'POST', 'fetch', json=req_body, **kwargs)
-                    break
-                except OioNetworkException:
-                    # Monotonic backoff
-                    if i < max_attempts - 1:
-                        sleep(i * 1.0)
-                        continue
-                    # Too many attempts
-                    raise
+        for page in self._chunk_fetch_pages(
+                volume, limit=limit, rebuild=rebuild,
+                container_id=container_id, max_attempts=max_attempts,
+                start_after=start_after, shuffle=shuffle, **kwargs):
+            for (key, value) in page:
+                # Faster than split(), no intermediate list
+                container, _, key = key.partition('|')
+                content, _, chunk = key.partition('|')
+                yield container, content, chunk, value
 
-            truncated = _resp.headers.get(
-                    HEADER_PREFIX + 'list-truncated')
-            if truncated is None:
-                # TODO(adu): Delete when it will no longer be used
-                if not resp_body:
-                    break
-                truncated = True
-                req_body['start_after'] = resp_body[-1][0]
-            else:
-                truncated = true_value(truncated)
-                if truncated:
-                    req_body['start_after'] = _resp.headers[
-                        HEADER_PREFIX + 'list-marker']
+    def chunk_fetch_batches(self, volume, limit=4096, rebuild=False,
+                            container_id=None, max_attempts=3,
+                            start_after=None, shuffle=False, **kwargs):
+        """
+        Fetch the list of chunks belonging to the specified volume,
+        one page of results at a time.
 
-            if shuffle:
-                random.shuffle(resp_body)
-            for (key, value) in resp_body:
-                container, content, chunk = key.split('|')
-                yield container, content, chunk, value
+        See `chunk_fetch` for the description of the parameters.
 
-            if not truncated:
-                break
+        :returns: a generator of lists of
+            (container, content, chunk, value) tuples
+        """
+        for page in self._chunk_fetch_pages(
+                volume, limit=limit, rebuild=rebuild,
+                container_id=container_id, max_attempts=max_attempts,
+                start_after=start_after, shuffle=shuffle, **kwargs):
+            batch = list()
+            for (key, value) in page:
+                container, _, key = key.partition('|')
+                content, _, chunk = key.partition('|')
+                batch.append((container, content, chunk, value))
+            yield batch
 
     def admin_incident_set(self, volume, date, **kwargs):
         body = {'date': int(float(date))}
@@ -583,9 +804,7 @@ class RdirClient(HttpApi):
         body = {'container_url': container_url,
                 'container_id': container_id,
                 'mtime': int(mtime)}
-
-        for key, value in kwargs.iteritems():
-            body[key] = value
+        body.update(kwargs)
 
         return self._rdir_request(volume=volume_id, method='POST',
                                   action='push', create=True, json=body,
@@ -627,9 +846,7 @@ class RdirClient(HttpApi):
 
         body = {'container_url': container_path,
                 'container_id': container_id}
-
-        for key, value in kwargs.iteritems():
-            body[key] = value
+        body.update(kwargs)
 
         return self._rdir_request(volume=volume_id, method='POST',
                                   action='delete', create=False, json=body,
@@ -64,6 +64,7 @@ enum http_rc_e action_conscience_resolve_service_id (struct req_args_s *args);
 enum http_rc_e action_ref_create (struct req_args_s *args);
 enum http_rc_e action_ref_destroy (struct req_args_s *args);
 enum http_rc_e action_ref_show (struct req_args_s *args);
+enum http_rc_e action_ref_show_many (struct req_args_s *args);
 enum http_rc_e action_ref_prop_get (struct req_args_s *args);
 enum http_rc_e action_ref_prop_set (struct req_args_s *args);
 enum http_rc_e action_ref_prop_del (struct req_args_s *args);
@@ -313,6 +313,9 @@ GString * _create_status_error (GError * e);
 
 enum http_rc_e _reply_common_error (struct req_args_s *args, GError *err);
 
+/* Get the HTTP status code _reply_common_error() would reply for `err` */
+gint _http_code_from_error (GError *err);
+
 /* -------------------------------------------------------------------------- */
 
 GError * conscience_remote_get_namespace(gchar **cs,
@@ -585,6 +585,115 @@ enum http_rc_e action_ref_show (struct req_args_s *args) {
 	return _reply_common_error (args, err);
 }
 
+static enum http_rc_e
+action_dir_ref_show_many (struct req_args_s *args, struct json_object *jargs)
+{
+	const char *type = TYPE();
+
+	if (!validate_namespace(NS()))
+		return _reply_forbidden_error(args, NEWERROR(
+					CODE_NAMESPACE_NOTMANAGED, "Namespace not managed"));
+	if (!oio_url_get(args->url, OIOURL_ACCOUNT))
+		return _reply_format_error(args, BADREQ("Missing account"));
+	if (!type)
+		return _reply_format_error(args, BADREQ("Missing service type"));
+
+	json_object *jarray = NULL;
+	if (!json_object_object_get_ex(jargs, "references", &jarray)
+			|| !json_object_is_type(jarray, json_type_array))
+		return _reply_format_error(args,
+				BADREQ("Invalid array of references"));
+
+	const guint jarray_len = json_object_array_length(jarray);
+	if (jarray_len > proxy_bulk_max_show_many)
+		return _reply_too_large(args, NEWERROR(HTTP_CODE_PAYLOAD_TO_LARGE,
+					"More than %u requested", proxy_bulk_max_show_many));
+
+	for (guint i = 0; i < jarray_len; i++) {
+		struct json_object *jref = json_object_array_get_idx(jarray, i);
+		if (!json_object_is_type(jref, json_type_string))
+			return _reply_format_error(args,
+					BADREQ("Invalid reference at [%u]", i));
+	}
+
+	GString *out = g_string_sized_new(2048);
+	g_string_append_static(out, "{\"references\":[");
+	for (guint i = 0; i < jarray_len; i++) {
+		struct json_object *jref = json_object_array_get_idx(jarray, i);
+		const gchar *name = json_object_get_string(jref);
+
+		oio_url_set(args->url, OIOURL_USER, name);
+		gchar **urlv = NULL;
+		GError *err = hc_resolve_reference_service(
+				resolver, args->url, type, &urlv, oio_ext_get_deadline());
+
+		if (i > 0)
+			g_string_append_c(out, ',');
+		g_string_append_c(out, '{');
+		oio_str_gstring_append_json_pair(out, "name", name);
+		g_string_append_c(out, ',');
+		if (err) {
+			_append_status(out, _http_code_from_error(err), err->message);
+			g_clear_error(&err);
+		} else {
+			_append_status(out, HTTP_CODE_OK, "ok");
+			g_string_append_static(out, ",\"srv\":");
+			out = _pack_and_freev_m1url_list(out, urlv);
+		}
+		g_string_append_c(out, '}');
+	}
+	g_string_append_static(out, "]}");
+
+	return _reply_success_json(args, out);
+}
+
+// DIR{{
+// POST /v3.0/{NS}/reference/show_many?acct={account}&type={type}
+// ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+// Get the services of the specified type linked to several references
+// of the same account, in one request.
+//
+// .. code-block:: json
+//
+//    {
+//      "references":["myreference","otherreference"]
+//    }
+//
+// Sample request:
+//
+// .. code-block:: http
+//
+//    POST /v3.0/OPENIO/reference/show_many?acct=my_account&type=rdir HTTP/1.1
+//    Host: 127.0.0.1:6000
+//    User-Agent: curl/7.47.0
+//    Accept: */*
+//    Content-Length: 47
+//    Content-Type: application/x-www-form-urlencoded
+//
+// Sample response:
+//
+// .. code-block:: http
+//
+//    HTTP/1.1 200 OK
+//    Connection: Close
+//    Content-Type: application/json
+//    Content-Length: 187
+//
+// .. code-block:: json
+//
+//    {
+//      "references":[
+//        {"name":"myreference","status":200,"message":"ok",
+//         "srv":[{"seq":1,"type":"rdir","host":"127.0.0.1:6010","args":""}]},
+//        {"name":"otherreference","status":404,"message":"Reference not found"}
+//      ]
+//    }
+//
+// }}DIR
+enum http_rc_e action_ref_show_many (struct req_args_s *args) {
+	return rest_action(args, action_dir_ref_show_many);
+}
+
 // DIR{{
 // POST /v3.0/{NS}/reference/destroy?acct={account}&ref={reference name}
 // ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -1024,6 +1024,7 @@ configure_request_handlers (void)
 	SET("/$NS/reference/create/#POST", action_ref_create);
 	SET("/$NS/reference/destroy/#POST", action_ref_destroy);
 	SET("/$NS/reference/show/#GET", action_ref_show);
+	SET("/$NS/reference/show_many/#POST", action_ref_show_many);
 	SET("/$NS/reference/get_properties/#POST", action_ref_prop_get);
 	SET("/$NS/reference/set_properties/#POST", action_ref_prop_set);
 	SET("/$NS/reference/del_properties/#POST", action_ref_prop_del);
@@ -157,6 +157,37 @@ _reply_common_error (struct req_args_s *args, GError *err)
 	return _reply_system_error (args, err);
 }
 
+gint
+_http_code_from_error (GError *err)
+{
+	/* Keep in sync with _reply_common_error() */
+	if (CODE_IS_NOTFOUND(err->code))
+		return HTTP_CODE_NOT_FOUND;
+	switch (err->code) {
+		case CODE_BAD_REQUEST:
+			return HTTP_CODE_BAD_REQUEST;
+		case CODE_TOOMANY_REDIRECT:
+		case CODE_UNAVAILABLE:
+		case CODE_GATEWAY_TIMEOUT:
+		case CODE_EXCESSIVE_LOAD:
+		case CODE_CORRUPT_DATABASE:
+		case CODE_CONTAINER_FROZEN:
+			return HTTP_CODE_SRV_UNAVAILABLE;
+		case CODE_NAMESPACE_NOTMANAGED:
+		case CODE_SRVTYPE_NOTMANAGED:
+			return HTTP_CODE_NOT_FOUND;
+		case CODE_CONTAINER_EXISTS:
+		case CODE_CONTENT_EXISTS:
+		case CODE_CONTENT_PRECONDITION:
+			return HTTP_CODE_CONFLICT;
+		case CODE_NOT_ALLOWED:
+			return HTTP_CODE_FORBIDDEN;
+		case CODE_METHOD_NOTALLOWED:
+			return HTTP_CODE_METHOD_NOT_ALLOWED;
+	}
+	return HTTP_CODE_INTERNAL_ERROR;
+}
+
 enum http_rc_e
 _reply_gateway_timeout (struct req_args_s *args, GError * err)
 {
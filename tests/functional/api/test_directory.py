@@ -295,6 +295,30 @@ class TestDirectoryAPI(BaseTestCase):
         # get on deleted reference
         self.assertRaises(exc.NotFound, self.api.list, self.account, name)
 
+    def test_list_many(self):
+        names = [random_str(32) for _ in range(3)]
+        for name in names[:2]:
+            self._create(name)
+
+        expected = {name: self.api.list(self.account, name,
+                                        service_type='echo')['srv']
+                    for name in names[:2]}
+
+        # Make sure the results come from the bulk route,
+        # not from the fallback to single requests.
+        self.api.list = Mock(side_effect=exc.ServiceBusy('fallback used'))
+        res = self.api.list_many(self.account, names, service_type='echo',
+                                 batch_size=2)
+        self.api.list.assert_not_called()
+        self.assertEqual(set(names), set(res.keys()))
+        for name in names[:2]:
+            self.assertEqual(expected[name], res[name]['srv'])
+        self.assertIsInstance(res[names[2]], exc.NotFound)
+        del self.api.list
+
+        for name in names[:2]:
+            self._delete(name)
+
     def test_link_rdir_to_zero_scored_rawx(self):
         disp = RdirDispatcher({'namespace': self.ns},
                               pool_manager=self.http_pool)
@@ -363,12 +387,16 @@ class TestDirectoryAPI(BaseTestCase):
         disp.cs.all_services = Mock(side_effect=_all_services)
         disp.cs.poll = Mock(side_effect=_poll)
 
+        def _list_many(account, refs, *args, **kwargs):
+            """Tell that no rdir is linked to any reference"""
+            return {ref: exc.NotFound() for ref in refs}
+
         # Mock the check method to avoid calling the proxy
-        disp.directory.list = Mock(side_effect=exc.NotFound)
+        disp.directory.list_many = Mock(side_effect=_list_many)
 
         # Mock the assignation methods so we can check the calls
-        disp._smart_link_rdir = \
-            Mock(wraps=disp._smart_link_rdir)
+        disp._link_rdir = \
+            Mock(wraps=disp._link_rdir)
         disp.directory.force = \
             Mock(wraps=disp.directory.force,
                  side_effect=side_effects)
@@ -379,14 +407,14 @@ class TestDirectoryAPI(BaseTestCase):
                           max_attempts=1)
 
         # But ensure all calls have been made
-        link_calls = [call(rawx['addr'], ANY, max_per_rdir=ANY, max_attempts=1,
-                           min_dist=ANY, service_type='rawx')
+        link_calls = [call(rawx['addr'], ANY, max_attempts=1,
+                           service_type='rawx')
                       for rawx in all_srvs['rawx']]
-        disp._smart_link_rdir.assert_has_calls(link_calls)
+        disp._link_rdir.assert_has_calls(link_calls, any_order=True)
         force_calls = \
             [call(RDIR_ACCT, rawx['addr'], 'rdir', ANY, autocreate=True)
              for rawx in all_srvs['rawx']]
-        disp.directory.force.assert_has_calls(force_calls)
+        disp.directory.force.assert_has_calls(force_calls, any_order=True)
 
     def test_link_rdir_fail_to_force_one(self):
         """
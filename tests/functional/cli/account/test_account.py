@@ -15,6 +15,7 @@
 
 import uuid
 import re
+from oio.account.client import AccountClient
 from tests.functional.cli import CliTestCase
 from testtools.matchers import Equals
 
@@ -22,6 +23,7 @@ from testtools.matchers import Equals
 HEADERS = ['Name', 'Created']
 ACCOUNT_FIELDS = ['bytes', 'containers', 'ctime', 'account', 'metadata',
                   'objects', 'damaged_objects', 'missing_chunks']
+_TABLE_ROW = re.compile(r"\|\s*(?P<k>\S+)\s*\|\s*(?P<v>\S+)\s*\|")
 
 
 class AccountTest(CliTestCase):
@@ -29,81 +31,81 @@ class AccountTest(CliTestCase):
 
     NAME = uuid.uuid4().hex
 
+    @classmethod
+    def setUpClass(cls):
+        super(AccountTest, cls).setUpClass()
+        cls.account_client = AccountClient(cls._cls_conf)
+        cls.openio('account create ' + cls.NAME)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.openio('account delete ' + cls.NAME)
+        super(AccountTest, cls).tearDownClass()
+
     def test_account(self):
+        name = uuid.uuid4().hex
         opts = self.get_opts([], 'json')
-        output = self.openio('account create ' + self.NAME + opts)
+        output = self.openio('account create ' + name + opts)
         data = self.json_loads(output)
         self.assertThat(len(data), Equals(1))
         self.assert_list_fields(data, HEADERS)
         item = data[0]
-        self.assertThat(item['Name'], Equals(self.NAME))
+        self.assertThat(item['Name'], Equals(name))
         self.assertThat(item['Created'], Equals(True))
         opts = self.get_opts([], 'json')
-        output = self.openio('account set -p test=1 ' + self.NAME)
-        output = self.openio('account show ' + self.NAME + opts)
+        output = self.openio('account set -p test=1 ' + name)
+        output = self.openio('account show ' + name + opts)
         data = self.json_loads(output)
         self.assert_show_fields(data, ACCOUNT_FIELDS)
-        self.assertThat(data['account'], Equals(self.NAME))
+        self.assertThat(data['account'], Equals(name))
         self.assertThat(data['bytes'], Equals(0))
         self.assertThat(data['containers'], Equals(0))
         self.assertThat(data['objects'], Equals(0))
         self.assertThat(data['damaged_objects'], Equals(0))
         self.assertThat(data['missing_chunks'], Equals(0))
         self.assertThat(data['metadata']['test'], Equals('1'))
-        output = self.openio('account delete ' + self.NAME)
+        output = self.openio('account delete ' + name)
         self.assertOutput('', output)
 
     def test_account_show_table(self):
-        self.openio('account create ' + self.NAME)
         opts = self.get_opts([], 'table')
         output = self.openio('account show ' + self.NAME + opts)
-        regex = r"|\s*%s\s*|\s*%s\s*|"
-        self.assertIsNotNone(re.match(regex % ("bytes", "0B"), output))
-        self.assertIsNotNone(re.match(regex % ("objects", "0"), output))
-        self.assertIsNotNone(re.match(regex % ("damaged_objects", "0"),
-                                      output))
-        self.assertIsNotNone(re.match(regex % ("missing_chunks", "0"), output))
+        rows = dict((m.group('k'), m.group('v'))
+                    for m in _TABLE_ROW.finditer(output))
+        self.assertEqual('0B', rows.get('bytes'))
+        self.assertEqual('0', rows.get('objects'))
+        self.assertEqual('0', rows.get('damaged_objects'))
+        self.assertEqual('0', rows.get('missing_chunks'))
 
     def test_account_refresh(self):
-        self.openio('account create ' + self.NAME)
         self.openio('account refresh ' + self.NAME)
-        opts = self.get_opts([], 'json')
-        output = self.openio('account show ' + self.NAME + opts)
-        data = self.json_loads(output)
-        self.assertEqual(data['account'], self.NAME)
+        data = self.account_client.account_show(self.NAME)
+        self.assertEqual(data['id'], self.NAME)
         self.assertEqual(data['bytes'], 0)
         self.assertEqual(data['containers'], 0)
         self.assertEqual(data['objects'], 0)
         self.assertEqual(data['damaged_objects'], 0)
         self.assertEqual(data['missing_chunks'], 0)
-        self.openio('account delete ' + self.NAME)
 
     def test_account_refresh_all(self):
-        self.openio('account create ' + self.NAME)
         self.openio('account refresh ' + self.NAME + ' --all')
-        opts = self.get_opts([], 'json')
-        output = self.openio('account show ' + self.NAME + opts)
-        data = self.json_loads(output)
-        self.assertEqual(data['account'], self.NAME)
+        data = self.account_client.account_show(self.NAME)
+        self.assertEqual(data['id'], self.NAME)
         self.assertEqual(data['bytes'], 0)
         self.assertEqual(data['containers'], 0)
         self.assertEqual(data['objects'], 0)
         self.assertEqual(data['damaged_objects'], 0)
         self.assertEqual(data['missing_chunks'], 0)
-        self.openio('account delete ' + self.NAME)
 
     def test_account_flush(self):
-        self.openio('account create ' + self.NAME)
-        self.openio('container create ' + self.NAME)
+        container = uuid.uuid4().hex
+        self.openio('container create ' + container)
         self.openio('account flush ' + self.NAME)
-        opts = self.get_opts([], 'json')
-        output = self.openio('account show ' + self.NAME + opts)
-        data = self.json_loads(output)
-        self.assertEqual(data['account'], self.NAME)
+        data = self.account_client.account_show(self.NAME)
+        self.assertEqual(data['id'], self.NAME)
         self.assertEqual(data['bytes'], 0)
         self.assertEqual(data['containers'], 0)
         self.assertEqual(data['objects'], 0)
         self.assertEqual(data['damaged_objects'], 0)
         self.assertEqual(data['missing_chunks'], 0)
-        self.openio('container delete ' + self.NAME)
-        self.openio('account delete ' + self.NAME)
+        self.openio('container delete ' + container)
@@ -214,3 +214,102 @@ class DirectoryTest(unittest.TestCase):
         data = json.dumps(properties)
         api._direct_request.assert_called_once_with(
             'POST', uri, data=data, params=params)
+
+    @staticmethod
+    def _show_many_reply(data, srv=None, statuses=None):
+        """Build a reference/show_many reply for the request `data`."""
+        references = list()
+        for name in json.loads(data)['references']:
+            status = (statuses or {}).get(name, 200)
+            item = {'name': name, 'status': status, 'message': 'n/a'}
+            if status == 200:
+                item['srv'] = srv or list()
+            references.append(item)
+        return FakeApiResponse(), {'references': references}
+
+    def test_list_many(self):
+        api = self.api
+        names = [random_str(32) for _ in range(3)]
+        srv = [{"seq": 1, "type": "rdir", "host": "127.0.0.1:6000",
+                "args": ""}]
+
+        def _show_many(_method, _uri, data=None, **_kwargs):
+            return self._show_many_reply(
+                data, srv=srv, statuses={names[1]: 404, names[2]: 503})
+
+        api._direct_request = Mock(side_effect=_show_many)
+        res = api.list_many(self.account, names, service_type='rdir',
+                            concurrency=1)
+        uri = "%s/reference/show_many" % self.uri_base
+        params = {'acct': self.account, 'type': 'rdir'}
+        data = json.dumps({'references': names})
+        api._direct_request.assert_called_once_with(
+            'POST', uri, params=params, data=data)
+        self.assertEqual({'srv': srv}, res[names[0]])
+        self.assertIsInstance(res[names[1]], exceptions.NotFound)
+        self.assertIsInstance(res[names[2]], exceptions.ServiceBusy)
+
+    def test_list_many_batches_from_concurrency(self):
+        api = self.api
+        names = [random_str(32) for _ in range(10)]
+
+        def _show_many(_method, _uri, data=None, **_kwargs):
+            return self._show_many_reply(data)
+
+        api._direct_request = Mock(side_effect=_show_many)
+        res = api.list_many(self.account, names, service_type='rdir',
+                            concurrency=4)
+        # 10 references among 4 requests: at most 3 per request
+        self.assertEqual(4, api._direct_request.call_count)
+        for call_ in api._direct_request.call_args_list:
+            data = json.loads(call_[1]['data'])
+            self.assertLessEqual(len(data['references']), 3)
+        self.assertEqual(set(names), set(res.keys()))
+
+    def test_list_many_too_large(self):
+        api = self.api
+        names = [random_str(32) for _ in range(3)]
+
+        def _show_many(_method, _uri, data=None, **_kwargs):
+            if len(json.loads(data)['references']) > 1:
+                raise exceptions.TooLarge()
+            return self._show_many_reply(data)
+
+        api._direct_request = Mock(side_effect=_show_many)
+        res = api.list_many(self.account, names, service_type='rdir',
+                            concurrency=1)
+        # 3 refs, then 1 + 2 refs, then 1 + 1 refs
+        self.assertEqual(5, api._direct_request.call_count)
+        self.assertEqual({name: {'srv': []} for name in names}, res)
+
+    def test_list_many_not_supported(self):
+        api = self.api
+        names = [random_str(32) for _ in range(2)]
+        api._direct_request = Mock(side_effect=exceptions.NotFound())
+        api.list = Mock(side_effect=[{'srv': []},
+                                     exceptions.ServiceBusy()])
+        res = api.list_many(self.account, names, service_type='rdir',
+                            concurrency=1)
+        self.assertEqual(1, api._direct_request.call_count)
+        self.assertEqual(2, api.list.call_count)
+        self.assertEqual({'srv': []}, res[names[0]])
+        self.assertIsInstance(res[names[1]], exceptions.ServiceBusy)
+
+    def test_list_many_batch_error(self):
+        api = self.api
+        names = [random_str(32) for _ in range(4)]
+        error = exceptions.ServiceBusy()
+
+        def _show_many(_method, _uri, data=None, **_kwargs):
+            if names[0] in json.loads(data)['references']:
+                raise error
+            return self._show_many_reply(data)
+
+        api._direct_request = Mock(side_effect=_show_many)
+        res = api.list_many(self.account, names, service_type='rdir',
+                            batch_size=2, concurrency=1)
+        self.assertEqual(2, api._direct_request.call_count)
+        self.assertIs(error, res[names[0]])
+        self.assertIs(error, res[names[1]])
+        self.assertEqual({'srv': []}, res[names[2]])
+        self.assertEqual({'srv': []}, res[names[3]])
@@ -13,10 +13,14 @@
 # You should have received a copy of the GNU Lesser General Public
 # License along with this library.
 
+import json
 import unittest
-from mock import MagicMock as Mock
+from mock import MagicMock as Mock, patch
 
-from oio.rdir.client import RdirClient
+from oio.common.constants import REQID_HEADER
+from oio.common.exceptions import NotFound, OioException, \
+    ServiceUnavailable, VolumeException
+from oio.rdir.client import RdirClient, RdirDispatcher
 from tests.utils import random_id
 from tests.unit.api import FakeResponse
 
@@ -103,6 +107,289 @@ class TestRdirClient(unittest.TestCase):
         self.assertRaises(StopIteration, gen.next)
         self.assertEqual(self.rdir_client._direct_request.call_count, 3)
 
+    def test_fetch_batches(self):
+        self.rdir_client._direct_request = Mock(
+            side_effect=[
+                (
+                    FakeResponse(200),
+                    [
+                        ["%s|%s|%s" %
+                         (self.container_id_1, self.content_id_1,
+                          self.chunk_id_1), {'mtime': 10}],
+                        ["%s|%s|%s" %
+                         (self.container_id_2, self.content_id_2,
+                          self.chunk_id_2), {'mtime': 20}],
+                    ]
+                ),
+                (
+                    FakeResponse(200),
+                    [
+                        ["%s|%s|%s" %
+                         (self.container_id_3, self.content_id_3,
+                          self.chunk_id_3), {'mtime': 30}],
+                    ]
+                )
+            ])
+        gen = self.rdir_client.chunk_fetch_batches("volume", limit=2)
+        self.assertEqual(
+            gen.next(), [(self.container_id_1, self.content_id_1,
+                          self.chunk_id_1, {'mtime': 10}),
+                         (self.container_id_2, self.content_id_2,
+                          self.chunk_id_2, {'mtime': 20})])
+        self.assertEqual(
+            gen.next(), [(self.container_id_3, self.content_id_3,
+                          self.chunk_id_3, {'mtime': 30})])
+        self.assertRaises(StopIteration, gen.next)
+        self.assertEqual(self.rdir_client._direct_request.call_count, 3)
+
+    def test_fetch_batches_stopped_early(self):
+        self.rdir_client._direct_request = Mock(
+            side_effect=[
+                (
+                    FakeResponse(200, headers={
+                        'x-oio-list-truncated': 'true',
+                        'x-oio-list-marker': self.container_id_1}),
+                    [
+                        ["%s|%s|%s" %
+                         (self.container_id_1, self.content_id_1,
+                          self.chunk_id_1), {'mtime': 10}],
+                    ]
+                )
+            ])
+        with patch('oio.rdir.client.greenthread') as greenthread:
+            gen = self.rdir_client.chunk_fetch_batches("volume", limit=1)
+            gen.next()
+            gen.close()
+        self.assertEqual(greenthread.spawn.call_count, 1)
+        greenthread.spawn.return_value.kill.assert_called_once_with()
+
+    def test_push_json_body(self):
+        self.rdir_client.pool_manager.request = Mock(
+            return_value=Mock(status=204, data='', headers={}))
+        headers = {REQID_HEADER: 'test_push_json_body'}
+        self.rdir_client.chunk_push(
+            "volume", self.container_id_1, self.content_id_1,
+            self.chunk_id_1, headers=headers, content_path='a/b/c', mtime=10)
+        req_kwargs = self.rdir_client.pool_manager.request.call_args[1]
+        self.assertEqual('application/json',
+                         req_kwargs['headers']['Content-Type'])
+        self.assertEqual({'container_id': self.container_id_1,
+                          'content_id': self.content_id_1,
+                          'chunk_id': self.chunk_id_1,
+                          'content_path': 'a/b/c',
+                          'mtime': 10},
+                         json.loads(req_kwargs['body']))
+        # The headers of the caller are left untouched
+        self.assertNotIn('Content-Type', headers)
+
+
+class TestRdirClientAddrCache(unittest.TestCase):
+    def setUp(self):
+        super(TestRdirClientAddrCache, self).setUp()
+        self.rdir_client = RdirClient({'namespace': 'dummy',
+                                       'rdir_addr_cache_size': 2},
+                                      endpoint='127.0.0.0:6000')
+
+    def tearDown(self):
+        super(TestRdirClientAddrCache, self).tearDown()
+        del self.rdir_client
+
+    @staticmethod
+    def _linked(host):
+        return {'srv': [{'type': 'rdir', 'host': host}]}
+
+    def test_cache_is_bounded(self):
+        self.rdir_client.directory.list = Mock(
+            side_effect=[self._linked('0.1.2.3:4567'),
+                         self._linked('0.1.2.4:4567'),
+                         self._linked('0.1.2.5:4567')])
+        self.rdir_client._get_rdir_addr('vol1')
+        self.rdir_client._get_rdir_addr('vol2')
+        # Hit, 'vol1' becomes the most recently used
+        self.rdir_client._get_rdir_addr('vol1')
+        self.rdir_client._get_rdir_addr('vol3')
+        self.assertEqual(['vol1', 'vol3'],
+                         list(self.rdir_client._addr_cache.keys()))
+        self.assertEqual(3, self.rdir_client.directory.list.call_count)
+
+    def test_not_found_is_cached(self):
+        self.rdir_client.directory.list = Mock(side_effect=NotFound())
+        self.assertRaises(VolumeException,
+                          self.rdir_client._get_rdir_addr, 'vol1')
+        self.assertRaises(VolumeException,
+                          self.rdir_client._get_rdir_addr, 'vol1')
+        self.assertEqual(1, self.rdir_client.directory.list.call_count)
+        self.rdir_client._clear_cache('vol1')
+        self.assertRaises(VolumeException,
+                          self.rdir_client._get_rdir_addr, 'vol1')
+        self.assertEqual(2, self.rdir_client.directory.list.call_count)
+
+    def test_warm_cache(self):
+        self.rdir_client.directory.list = Mock(side_effect=NotFound())
+        self.assertRaises(VolumeException,
+                          self.rdir_client._get_rdir_addr, 'vol1')
+        self.rdir_client.warm_cache({'vol1': '0.1.2.3:4567'})
+        self.assertEqual('0.1.2.3:4567',
+                         self.rdir_client._get_rdir_addr('vol1'))
+        self.assertEqual(1, self.rdir_client.directory.list.call_count)
+
+
+class TestRdirDispatcher(unittest.TestCase):
+    def setUp(self):
+        super(TestRdirDispatcher, self).setUp()
+        self.disp = RdirDispatcher({'namespace': 'dummy'},
+                                   endpoint='127.0.0.0:6000')
+        self.rdir_prefix = 'dummy|rdir|'
+        self.all_rdir = [self._srv('127.0.0.1:1', 1),
+                         self._srv('127.0.0.2:1', 3)]
+        self.all_rawx = [self._srv('127.0.1.1:1'),
+                         self._srv('127.0.1.2:1')]
+        self.disp._cs = Mock()
+        self.disp._cs.all_services = Mock(side_effect=self._all_services)
+
+    def tearDown(self):
+        super(TestRdirDispatcher, self).tearDown()
+        del self.disp
+
+    @staticmethod
+    def _srv(addr, opened_db_count=None, score=50):
+        srv = {'addr': addr, 'score': score, 'tags': {}}
+        if opened_db_count is not None:
+            srv['tags']['stat.opened_db_count'] = opened_db_count
+        return srv
+
+    def _all_services(self, type_, *_args, **_kwargs):
+        return self.all_rdir if type_ == 'rdir' else self.all_rawx
+
+    def _rdir_calls(self):
+        return [call_ for call_ in self.disp._cs.all_services.call_args_list
+                if call_[0][0] == 'rdir']
+
+    def _polled(self, addr):
+        return {'addr': addr, 'id': self.rdir_prefix + addr}
+
+    def test_rdir_cache_ttl(self):
+        self.disp._all_rdir_cached()
+        self.disp._all_rdir_cached()
+        self.assertEqual(1, len(self._rdir_calls()))
+        self.disp._all_rdir_cached(ttl=0.0)
+        self.assertEqual(2, len(self._rdir_calls()))
+
+    def test_rdir_cache_is_not_modified_by_callers(self):
+        self.disp.directory.list_many = Mock(return_value={
+            '127.0.1.1:1': {'srv': [{'type': 'rdir',
+                                     'host': '127.0.0.1:1'}]}})
+        all_rawx, all_rdir = self.disp.get_assignments('rawx')
+        rdir = all_rawx[0]['rdir']
+        rdir['managed_svc'] = ['127.0.1.1:1']
+        rdir['tags']['stat.opened_db_count'] = 42
+        all_rdir[1]['tags']['stat.opened_db_count'] = 42
+
+        all_rdir, by_id = self.disp._all_rdir_cached()
+        self.assertEqual(1, len(self._rdir_calls()))
+        self.assertEqual([self._srv('127.0.0.1:1', 1),
+                          self._srv('127.0.0.2:1', 3)], all_rdir)
+        self.assertEqual(
+            {self.rdir_prefix + '127.0.0.1:1': all_rdir[0],
+             self.rdir_prefix + '127.0.0.2:1': all_rdir[1]}, by_id)
+
+    def test_link_rdir_clears_rdir_cache(self):
+        self.disp.directory.force = Mock()
+        self.disp.rdir.create = Mock()
+        self.disp._all_rdir_cached()
+        self.disp._link_rdir('127.0.1.1:1', self._polled('127.0.0.1:1'))
+        self.disp._all_rdir_cached()
+        self.assertEqual(2, len(self._rdir_calls()))
+
+    def test_assign_rdir_missing_from_cache(self):
+        self.disp.directory.list_many = Mock(return_value={
+            '127.0.1.1:1': {'srv': [{'type': 'rdir',
+                                     'host': '127.0.0.1:1'}]}})
+        # Selected by the load balancer, but unknown to the cached list
+        self.disp._poll_rdir = Mock(return_value=self._polled('127.0.0.9:1'))
+        self.disp._link_rdir = Mock()
+        all_rawx = self.disp.assign_services('rawx')
+        self.assertEqual('127.0.0.9:1', all_rawx[1]['rdir']['addr'])
+        self.assertEqual(1, all_rawx[1]['rdir']['tags'].get(
+            'stat.opened_db_count'))
+        # The outdated list has been dropped
+        self.disp._all_rdir_cached()
+        self.assertEqual(2, len(self._rdir_calls()))
+
+    def test_compute_avoids_average(self):
+        all_rdir = [self._srv('127.0.0.1:1', 1),
+                    self._srv('127.0.0.2:1', 3),
+                    self._srv('127.0.0.3:1', 2),
+                    # Not valid, not counted in the average
+                    self._srv('127.0.0.4:1', 12, score=0)]
+        avoids, upper_limit, n_valid = self.disp._compute_avoids(all_rdir)
+        self.assertEqual([self.rdir_prefix + '127.0.0.2:1'], avoids)
+        self.assertEqual(2.0, upper_limit)
+        self.assertEqual(3, n_valid)
+
+    def test_compute_avoids_max_per_rdir(self):
+        all_rdir = [self._srv('127.0.0.1:1', 1),
+                    self._srv('127.0.0.2:1', 3),
+                    self._srv('127.0.0.3:1', 2),
+                    self._srv('127.0.0.4:1', 12, score=0)]
+        avoids, upper_limit, n_valid = self.disp._compute_avoids(
+            all_rdir, max_per_rdir=3)
+        self.assertEqual([self.rdir_prefix + '127.0.0.2:1'], avoids)
+        self.assertEqual(2, upper_limit)
+        self.assertEqual(3, n_valid)
+
+    def test_compute_avoids_no_valid_rdir(self):
+        all_rdir = [self._srv('127.0.0.1:1', 1, score=0)]
+        self.assertRaises(ServiceUnavailable,
+                          self.disp._compute_avoids, all_rdir)
+
+    def test_assign_services_avoids(self):
+        self.all_rdir = [self._srv('127.0.0.1:1', 0),
+                         self._srv('127.0.0.2:1', 0)]
+        self.all_rawx = [self._srv('127.0.1.%d:1' % i) for i in range(3)]
+        self.disp.directory.list_many = Mock(return_value={})
+        self.disp._link_rdir = Mock()
+        self.disp._compute_avoids = Mock(wraps=self.disp._compute_avoids)
+        polled = [self._polled('127.0.0.1:1'),
+                  self._polled('127.0.0.2:1'),
+                  self._polled('127.0.0.1:1')]
+        avoided = list()
+
+        def _poll_rdir(avoid=None, **_kwargs):
+            # The list is modified in place, keep a copy
+            avoided.append(list(avoid))
+            return polled[len(avoided) - 1]
+
+        self.disp._poll_rdir = Mock(side_effect=_poll_rdir)
+        all_rawx = self.disp.assign_services('rawx')
+        self.assertEqual(
+            [[],
+             # Over the average after its first base
+             [self.rdir_prefix + '127.0.0.1:1'],
+             # Computed again after 2 (valid rdir services) links
+             []],
+            avoided)
+        self.assertEqual(2, self.disp._compute_avoids.call_count)
+        self.assertEqual([2, 1, 2],
+                         [rawx['rdir']['tags']['stat.opened_db_count']
+                          for rawx in all_rawx])
+
+    def test_assign_services_link_failure(self):
+        self.all_rdir = [self._srv('127.0.0.1:1', 0)]
+        self.disp.directory.list_many = Mock(return_value={})
+        self.disp._poll_rdir = Mock(return_value=self._polled('127.0.0.1:1'))
+
+        def _link_rdir(volume_id, *_args, **_kwargs):
+            if volume_id == '127.0.1.1:1':
+                raise OioException('failed to link')
+
+        self.disp._link_rdir = Mock(side_effect=_link_rdir)
+        self.assertRaises(OioException, self.disp.assign_services, 'rawx')
+        self.assertNotIn('rdir', self.all_rawx[0])
+        # Only the successful link is counted
+        self.assertEqual(
+            1, self.all_rawx[1]['rdir']['tags']['stat.opened_db_count'])
+
 
 class TestRdirMeta2Client(unittest.TestCase):
     def setUp(self):